@@ -1,7 +1,9 @@
 package cmd
 
 import (
+	"bufio"
 	"fmt"
+	"os"
 	"strconv"
 
 	"github.com/emerson000/anytone-cli/pkg/codeplug"
@@ -23,7 +25,16 @@ var getChannelCmd = &cobra.Command{
 	Use:   "channel [index]",
 	Short: "Get channel(s). If no index is provided, returns all channels.",
 	RunE: func(cmd *cobra.Command, args []string) error {
-		cp, err := codeplug.Open(codeplugFile)
+		var index int
+		if len(args) > 0 {
+			var err error
+			index, err = strconv.Atoi(args[0])
+			if err != nil {
+				return fmt.Errorf("invalid index: %w", err)
+			}
+		}
+
+		cp, err := codeplug.OpenReadOnly(codeplugFile)
 		if err != nil {
 			return fmt.Errorf("failed to open codeplug: %w", err)
 		}
@@ -34,15 +45,11 @@ var getChannelCmd = &cobra.Command{
 			if err != nil {
 				return fmt.Errorf("failed to get channels: %w", err)
 			}
+			w := bufio.NewWriter(os.Stdout)
 			for i, channel := range channels {
-				fmt.Printf("%d: %s (Rx: %.4f MHz, Tx: %.4f MHz)\n", i, channel.Name, float64(channel.RxFreq)/100000, float64(channel.TxFreq)/100000)
+				fmt.Fprintf(w, "%d: %s (Rx: %.4f MHz, Tx: %.4f MHz)\n", i, channel.Name, float64(channel.RxFreq)/100000, float64(channel.TxFreq)/100000)
 			}
-			return nil
-		}
-
-		index, err := strconv.Atoi(args[0])
-		if err != nil {
-			return fmt.Errorf("invalid index: %w", err)
+			return w.Flush()
 		}
 
 		channel, err := cp.GetChannelByIndex(index)
@@ -50,21 +57,22 @@ var getChannelCmd = &cobra.Command{
 			return fmt.Errorf("failed to get channel: %w", err)
 		}
 
-		fmt.Printf("Channel %d:\n", index)
-		fmt.Printf("  Name: %s\n", channel.Name)
-		fmt.Printf("  Rx Frequency: %.4f MHz\n", float64(channel.RxFreq)/100000)
-		fmt.Printf("  Tx Frequency: %.4f MHz\n", float64(channel.TxFreq)/100000)
-		fmt.Printf("  Channel Type: %d\n", channel.ChannelType)
-		fmt.Printf("  Tx Power: %d\n", channel.TxPower)
-		fmt.Printf("  Bandwidth: %d\n", channel.Bandwidth)
-		fmt.Printf("  CTCSS/DCS Decode: %d\n", channel.CtcssDcsDecode)
-		fmt.Printf("  CTCSS/DCS Encode: %d\n", channel.CtcssDcsEncode)
-		fmt.Printf("  Radio ID: %d\n", channel.RadioId)
-		fmt.Printf("  Scan List: %d\n", channel.ScanList)
-		fmt.Printf("  Color Code: %d\n", channel.RxColorCode)
-		fmt.Printf("  Slot: %d\n", channel.Slot)
+		w := bufio.NewWriter(os.Stdout)
+		fmt.Fprintf(w, "Channel %d:\n", index)
+		fmt.Fprintf(w, "  Name: %s\n", channel.Name)
+		fmt.Fprintf(w, "  Rx Frequency: %.4f MHz\n", float64(channel.RxFreq)/100000)
+		fmt.Fprintf(w, "  Tx Frequency: %.4f MHz\n", float64(channel.TxFreq)/100000)
+		fmt.Fprintf(w, "  Channel Type: %d\n", channel.ChannelType)
+		fmt.Fprintf(w, "  Tx Power: %d\n", channel.TxPower)
+		fmt.Fprintf(w, "  Bandwidth: %d\n", channel.Bandwidth)
+		fmt.Fprintf(w, "  CTCSS/DCS Decode: %d\n", channel.CtcssDcsDecode)
+		fmt.Fprintf(w, "  CTCSS/DCS Encode: %d\n", channel.CtcssDcsEncode)
+		fmt.Fprintf(w, "  Radio ID: %d\n", channel.RadioId)
+		fmt.Fprintf(w, "  Scan List: %d\n", channel.ScanList)
+		fmt.Fprintf(w, "  Color Code: %d\n", channel.RxColorCode)
+		fmt.Fprintf(w, "  Slot: %d\n", channel.Slot)
 
-		return nil
+		return w.Flush()
 	},
 }
 
@@ -72,7 +80,16 @@ var getRadioIDCmd = &cobra.Command{
 	Use:   "radio_id [index]",
 	Short: "Get radio ID(s). If no index is provided, returns all radio IDs.",
 	RunE: func(cmd *cobra.Command, args []string) error {
-		cp, err := codeplug.Open(codeplugFile)
+		var index int
+		if len(args) > 0 {
+			var err error
+			index, err = strconv.Atoi(args[0])
+			if err != nil {
+				return fmt.Errorf("invalid index: %w", err)
+			}
+		}
+
+		cp, err := codeplug.OpenReadOnly(codeplugFile)
 		if err != nil {
 			return fmt.Errorf("failed to open codeplug: %w", err)
 		}
@@ -83,15 +100,11 @@ var getRadioIDCmd = &cobra.Command{
 			if err != nil {
 				return fmt.Errorf("failed to get radio IDs: %w", err)
 			}
+			w := bufio.NewWriter(os.Stdout)
 			for _, entry := range radioIDs {
-				fmt.Printf("%d: %d (%s)\n", entry.Index, entry.ID, entry.Name)
+				fmt.Fprintf(w, "%d: %d (%s)\n", entry.Index, entry.ID, entry.Name)
 			}
-			return nil
-		}
-
-		index, err := strconv.Atoi(args[0])
-		if err != nil {
-			return fmt.Errorf("invalid index: %w", err)
+			return w.Flush()
 		}
 
 		radioID, err := cp.GetRadioIDByIndex(index)
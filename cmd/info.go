@@ -1,7 +1,9 @@
 package cmd
 
 import (
+	"bufio"
 	"fmt"
+	"os"
 
 	"github.com/emerson000/anytone-cli/pkg/codeplug"
 	"github.com/spf13/cobra"
@@ -15,7 +17,7 @@ var infoCmd = &cobra.Command{
 			return fmt.Errorf("codeplug file path is required")
 		}
 
-		cp, err := codeplug.Open(codeplugFile)
+		cp, err := codeplug.OpenReadOnly(codeplugFile)
 		if err != nil {
 			return fmt.Errorf("failed to open codeplug: %w", err)
 		}
@@ -26,12 +28,13 @@ var infoCmd = &cobra.Command{
 			return fmt.Errorf("failed to get codeplug info: %w", err)
 		}
 
-		fmt.Printf("Model: %s\n", info.Model)
-		fmt.Printf("Radio IDs:\n")
+		w := bufio.NewWriter(os.Stdout)
+		fmt.Fprintf(w, "Model: %s\n", info.Model)
+		fmt.Fprintf(w, "Radio IDs:\n")
 		for i, id := range info.RadioIDs {
-			fmt.Printf("  %d: %d\n", info.RadioIDIndices[i], id)
+			fmt.Fprintf(w, "  %d: %d\n", info.RadioIDIndices[i], id)
 		}
 
-		return nil
+		return w.Flush()
 	},
 }
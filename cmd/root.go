@@ -2,6 +2,7 @@ package cmd
 
 import (
 	"os"
+	"strings"
 
 	"github.com/spf13/cobra"
 )
@@ -17,32 +18,26 @@ without using the official CPS software.`,
 }
 
 func Execute() error {
-	if len(os.Args) > 1 && os.Args[1][0] != '-' {
-		if isCommand(os.Args[1]) {
-			return rootCmd.Execute()
-		}
-
-		codeplugFile = os.Args[1]
-
-		if len(os.Args) > 2 {
-			newArgs := make([]string, 0, len(os.Args)-1)
-			newArgs = append(newArgs, os.Args[0])
-			newArgs = append(newArgs, os.Args[2:]...)
-			os.Args = newArgs
-		}
+	args := os.Args[1:]
+	if len(args) > 0 && !strings.HasPrefix(args[0], "-") && !isCommand(args[0]) {
+		codeplugFile = args[0]
+		rootCmd.SetArgs(args[1:])
 	}
 
 	return rootCmd.Execute()
 }
 
+var commands = map[string]struct{}{
+	"help":       {},
+	"completion": {},
+	"info":       {},
+	"set":        {},
+	"get":        {},
+}
+
 func isCommand(cmd string) bool {
-	commands := []string{"help", "completion", "info", "set", "get"}
-	for _, c := range commands {
-		if c == cmd {
-			return true
-		}
-	}
-	return false
+	_, ok := commands[cmd]
+	return ok
 }
 
 func init() {
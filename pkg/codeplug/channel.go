@@ -1,7 +1,17 @@
 package codeplug
 
 import (
+	"bytes"
+	"encoding/binary"
 	"fmt"
+	"io"
+)
+
+const (
+	channelNameOffset   = 49
+	channelMaxNameSize  = 32
+	channelTrailingSize = 27
+	channelMaxSize      = channelNameOffset + channelMaxNameSize + channelTrailingSize
 )
 
 type Channel struct {
@@ -41,53 +51,63 @@ type Channel struct {
 	DataAckDisable       byte
 	AutoScan             byte
 	SendTalkerAlias      byte
-	ExtendEncryption     byte
+	ExtendEncryption     byte // not decoded: lies past the 27 trailing bytes read per channel
 
 	NameOffset  int64
 	NameLength  int
 	TotalLength int
 }
 
-func (cp *Codeplug) readChannelMetadata(offset int64) (*Channel, error) {
-	adjustedOffset := offset
-
-	const nameOffset = 49
-	header := make([]byte, nameOffset)
-	if _, err := cp.file.ReadAt(header, adjustedOffset); err != nil {
-		return nil, fmt.Errorf("failed to read channel header at offset %d: %w", adjustedOffset, err)
+func (cp *Codeplug) readChannelRecord(offset int64, buf []byte) ([]byte, int, error) {
+	n, err := cp.file.ReadAt(buf, offset)
+	if err != nil && err != io.EOF {
+		return nil, 0, fmt.Errorf("failed to read channel at offset %d: %w", offset, err)
 	}
+	if n < channelNameOffset {
+		return nil, 0, fmt.Errorf("failed to read channel header at offset %d: unexpected end of file", offset)
+	}
+	buf = buf[:n]
 
-	nameStartOffset := adjustedOffset + nameOffset
-	nameBuf := make([]byte, 32)
-	if _, err := cp.file.ReadAt(nameBuf, nameStartOffset); err != nil {
-		return nil, fmt.Errorf("failed to read channel name at offset %d: %w", nameStartOffset, err)
+	nameStartOffset := offset + channelNameOffset
+	nameBuf := buf[channelNameOffset:]
+	if len(nameBuf) > channelMaxNameSize {
+		nameBuf = nameBuf[:channelMaxNameSize]
 	}
 
-	nameLength := 0
-	for i := 0; i < len(nameBuf); i++ {
-		if nameBuf[i] == 0x00 {
-			nameLength = i + 1
-			break
+	nameLength := bytes.IndexByte(nameBuf, 0x00) + 1
+
+	if nameLength == 0 {
+		if len(nameBuf) < channelMaxNameSize {
+			return nil, 0, fmt.Errorf("failed to read channel name at offset %d: unexpected end of file", nameStartOffset)
 		}
+		return nil, 0, fmt.Errorf("invalid channel name at offset %d: no null terminator found", nameStartOffset)
 	}
 
-	if nameLength == 0 {
-		return nil, fmt.Errorf("invalid channel name at offset %d: no null terminator found", nameStartOffset)
+	trailingStart := channelNameOffset + nameLength
+	if len(buf) < trailingStart+channelTrailingSize {
+		return nil, 0, fmt.Errorf("failed to read trailing fields at offset %d: unexpected end of file", nameStartOffset+int64(nameLength))
 	}
 
-	trailingFieldsOffset := nameStartOffset + int64(nameLength)
-	trailingFields := make([]byte, 27)
+	return buf[:trailingStart+channelTrailingSize], nameLength, nil
+}
 
-	if _, err := cp.file.ReadAt(trailingFields, trailingFieldsOffset); err != nil {
-		return nil, fmt.Errorf("failed to read trailing fields at offset %d: %w", trailingFieldsOffset, err)
+func (cp *Codeplug) readChannelMetadata(offset int64, buf []byte) (*Channel, error) {
+	record, nameLength, err := cp.readChannelRecord(offset, buf)
+	if err != nil {
+		return nil, err
 	}
 
-	totalLength := nameOffset + nameLength + len(trailingFields)
+	header := record[:channelNameOffset]
+	nameStartOffset := offset + channelNameOffset
+	nameBuf := record[channelNameOffset:]
+	trailingFields := record[channelNameOffset+nameLength:]
+
+	totalLength := channelNameOffset + nameLength + len(trailingFields)
 
 	channel := &Channel{
-		RxFreq:               uint32(header[3]) | uint32(header[4])<<8 | uint32(header[5])<<16 | uint32(header[6])<<24,
+		RxFreq:               binary.LittleEndian.Uint32(header[3:7]),
 		TxFreqDirection:      header[7],
-		TxFreq:               int32(header[8]) | int32(header[9])<<8 | int32(header[10])<<16 | int32(header[11])<<24,
+		TxFreq:               int32(binary.LittleEndian.Uint32(header[8:12])),
 		ChannelType:          header[12],
 		TxPower:              header[13],
 		Bandwidth:            header[14],
@@ -121,8 +141,7 @@ func (cp *Codeplug) readChannelMetadata(offset int64) (*Channel, error) {
 		SmsForbid:          trailingFields[17],
 		DataAckDisable:     trailingFields[18],
 		AutoScan:           trailingFields[21],
-		SendTalkerAlias:    getSafeByteValue(trailingFields, 22),
-		ExtendEncryption:   getSafeByteValue(trailingFields, 27),
+		SendTalkerAlias:    trailingFields[22],
 
 		NameOffset:  nameStartOffset,
 		NameLength:  nameLength,
@@ -132,19 +151,51 @@ func (cp *Codeplug) readChannelMetadata(offset int64) (*Channel, error) {
 	return channel, nil
 }
 
-func (cp *Codeplug) GetChannels() ([]*Channel, error) {
+func (cp *Codeplug) readTotalChannels() (int, error) {
 	channelCountBuf := make([]byte, 1)
 	if _, err := cp.file.ReadAt(channelCountBuf, totalChannelsAddress); err != nil {
-		return nil, fmt.Errorf("failed to read total channels: %w", err)
+		return 0, fmt.Errorf("failed to read total channels: %w", err)
+	}
+
+	return int(channelCountBuf[0]), nil
+}
+
+func (cp *Codeplug) readChannelLength(offset int64, buf []byte) (int, error) {
+	record, _, err := cp.readChannelRecord(offset, buf)
+	if err != nil {
+		return 0, err
 	}
 
-	totalChannels := int(channelCountBuf[0])
-	channelsStartOffset := int64(totalChannelsAddress + 1)
-	currentOffset := channelsStartOffset
+	return len(record), nil
+}
+
+func (cp *Codeplug) skipChannels(count int) (int64, error) {
+	currentOffset := int64(channelsStartOffset)
+	buf := make([]byte, channelMaxSize)
+
+	for i := 0; i < count; i++ {
+		length, err := cp.readChannelLength(currentOffset, buf)
+		if err != nil {
+			return 0, fmt.Errorf("failed to read channel %d: %w", i+1, err)
+		}
+		currentOffset += int64(length)
+	}
+
+	return currentOffset, nil
+}
+
+func (cp *Codeplug) GetChannels() ([]*Channel, error) {
+	totalChannels, err := cp.readTotalChannels()
+	if err != nil {
+		return nil, err
+	}
+
+	currentOffset := int64(channelsStartOffset)
 	channels := make([]*Channel, 0, totalChannels)
+	buf := make([]byte, channelMaxSize)
 
 	for i := 0; i < totalChannels; i++ {
-		channel, err := cp.readChannelMetadata(currentOffset)
+		channel, err := cp.readChannelMetadata(currentOffset, buf)
 		if err != nil {
 			return nil, fmt.Errorf("failed to read channel %d: %w", i+1, err)
 		}
@@ -156,26 +207,19 @@ func (cp *Codeplug) GetChannels() ([]*Channel, error) {
 }
 
 func (cp *Codeplug) GetChannelByIndex(index int) (*Channel, error) {
-	channelCountBuf := make([]byte, 1)
-	if _, err := cp.file.ReadAt(channelCountBuf, totalChannelsAddress); err != nil {
-		return nil, fmt.Errorf("failed to read total channels: %w", err)
+	totalChannels, err := cp.readTotalChannels()
+	if err != nil {
+		return nil, err
 	}
 
-	totalChannels := int(channelCountBuf[0])
 	if index < 0 || index >= totalChannels {
 		return nil, fmt.Errorf("invalid channel index: %d", index)
 	}
 
-	channelsStartOffset := int64(totalChannelsAddress + 1)
-	currentOffset := channelsStartOffset
-
-	for i := 0; i < index; i++ {
-		channel, err := cp.readChannelMetadata(currentOffset)
-		if err != nil {
-			return nil, fmt.Errorf("failed to read channel %d: %w", i+1, err)
-		}
-		currentOffset += int64(channel.TotalLength)
+	currentOffset, err := cp.skipChannels(index)
+	if err != nil {
+		return nil, err
 	}
 
-	return cp.readChannelMetadata(currentOffset)
+	return cp.readChannelMetadata(currentOffset, make([]byte, channelMaxSize))
 }
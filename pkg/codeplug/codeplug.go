@@ -6,8 +6,8 @@ import (
 )
 
 const (
-	headerSize           = 0x100
 	totalChannelsAddress = 0xF1
+	channelsStartOffset  = totalChannelsAddress + 1
 	modelOffset          = 0x09
 	modelSize            = 10
 	maxRadioIDs          = 10
@@ -25,7 +25,15 @@ type Info struct {
 }
 
 func Open(path string) (*Codeplug, error) {
-	file, err := os.OpenFile(path, os.O_RDWR, 0644)
+	return openFile(path, os.O_RDWR)
+}
+
+func OpenReadOnly(path string) (*Codeplug, error) {
+	return openFile(path, os.O_RDONLY)
+}
+
+func openFile(path string, flag int) (*Codeplug, error) {
+	file, err := os.OpenFile(path, flag, 0644)
 	if err != nil {
 		return nil, fmt.Errorf("failed to open file: %w", err)
 	}
@@ -40,11 +48,16 @@ func (cp *Codeplug) Close() error {
 	return cp.file.Close()
 }
 
-func getSafeByteValue(data []byte, index int) byte {
-	if index >= 0 && index < len(data) {
-		return data[index]
-	}
-	return 0
+func getUint24(data []byte) int {
+	_ = data[2]
+	return int(data[0]) | int(data[1])<<8 | int(data[2])<<16
+}
+
+func putUint24(data []byte, value int) {
+	_ = data[2]
+	data[0] = byte(value)
+	data[1] = byte(value >> 8)
+	data[2] = byte(value >> 16)
 }
 
 func (cp *Codeplug) GetInfo() (*Info, error) {
@@ -0,0 +1,299 @@
+package codeplug
+
+import (
+	"bytes"
+	"encoding/binary"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+type testChannel struct {
+	name   string
+	rxFreq uint32
+	txFreq uint32
+}
+
+type testRadioID struct {
+	index int
+	id    int
+	name  string
+}
+
+var (
+	testChannels = []testChannel{
+		{name: "Simplex", rxFreq: 14652000, txFreq: 14652000},
+		{name: "Repeater", rxFreq: 44512500, txFreq: 44012500},
+		{name: "", rxFreq: 43850000, txFreq: 43850000},
+	}
+	testRadioIDs = []testRadioID{
+		{index: 0, id: 3161234, name: "Home"},
+		{index: 1, id: 3165678, name: "Portable"},
+		{index: 3, id: 1234, name: "Club"},
+	}
+)
+
+func buildChannel(ch testChannel) []byte {
+	header := make([]byte, channelNameOffset)
+	binary.LittleEndian.PutUint32(header[3:7], ch.rxFreq)
+	binary.LittleEndian.PutUint32(header[8:12], ch.txFreq)
+	header[13] = 2
+	header[31] = 1
+
+	trailing := make([]byte, channelTrailingSize)
+	trailing[2] = 1
+	trailing[22] = 7
+
+	record := append(header, ch.name...)
+	record = append(record, 0x00)
+	return append(record, trailing...)
+}
+
+func buildCodeplug(channels []testChannel, radioIDs []testRadioID) []byte {
+	data := make([]byte, totalChannelsAddress)
+	copy(data[modelOffset:], "D878UVII")
+	data = append(data, byte(len(channels)))
+
+	for _, ch := range channels {
+		data = append(data, buildChannel(ch)...)
+	}
+
+	data = append(data, 0x00, 0x00)
+	for _, r := range radioIDs {
+		entry := make([]byte, radioIDHeaderSize)
+		entry[0] = byte(r.index)
+		putUint24(entry[1:4], r.id)
+		data = append(data, entry...)
+		data = append(data, r.name...)
+		data = append(data, 0x00)
+	}
+
+	return append(data, make([]byte, radioIDHeaderSize)...)
+}
+
+func radioIDTableOffset(channels []testChannel) int64 {
+	offset := int64(channelsStartOffset)
+	for _, ch := range channels {
+		offset += int64(len(buildChannel(ch)))
+	}
+	return offset + 2
+}
+
+func openTestCodeplug(t *testing.T, data []byte) (*Codeplug, string) {
+	t.Helper()
+
+	path := filepath.Join(t.TempDir(), "codeplug.rdt")
+	if err := os.WriteFile(path, data, 0644); err != nil {
+		t.Fatalf("failed to write codeplug: %v", err)
+	}
+
+	cp, err := Open(path)
+	if err != nil {
+		t.Fatalf("failed to open codeplug: %v", err)
+	}
+	t.Cleanup(func() { cp.Close() })
+
+	return cp, path
+}
+
+func TestGetInfo(t *testing.T) {
+	cp, _ := openTestCodeplug(t, buildCodeplug(testChannels, testRadioIDs))
+
+	info, err := cp.GetInfo()
+	if err != nil {
+		t.Fatalf("GetInfo() error: %v", err)
+	}
+
+	if want := "D878UVII\x00\x00"; info.Model != want {
+		t.Errorf("Model = %q, want %q", info.Model, want)
+	}
+	for i, r := range testRadioIDs {
+		if info.RadioIDs[i] != r.id || info.RadioIDIndices[i] != r.index {
+			t.Errorf("radio ID %d = (%d, %d), want (%d, %d)", i, info.RadioIDIndices[i], info.RadioIDs[i], r.index, r.id)
+		}
+	}
+}
+
+func TestGetChannels(t *testing.T) {
+	cp, _ := openTestCodeplug(t, buildCodeplug(testChannels, testRadioIDs))
+
+	channels, err := cp.GetChannels()
+	if err != nil {
+		t.Fatalf("GetChannels() error: %v", err)
+	}
+	if len(channels) != len(testChannels) {
+		t.Fatalf("GetChannels() returned %d channels, want %d", len(channels), len(testChannels))
+	}
+
+	offset := int64(channelsStartOffset)
+	for i, want := range testChannels {
+		got := channels[i]
+		if got.Name != want.name || got.RxFreq != want.rxFreq || got.TxFreq != int32(want.txFreq) {
+			t.Errorf("channel %d = (%q, %d, %d), want (%q, %d, %d)", i, got.Name, got.RxFreq, got.TxFreq, want.name, want.rxFreq, want.txFreq)
+		}
+		if got.TxPower != 2 || got.RadioId != 1 || got.Ranging != 1 || got.SendTalkerAlias != 7 {
+			t.Errorf("channel %d fields = %+v", i, *got)
+		}
+		if got.NameOffset != offset+channelNameOffset {
+			t.Errorf("channel %d NameOffset = %d, want %d", i, got.NameOffset, offset+channelNameOffset)
+		}
+		if wantLength := len(buildChannel(want)); got.TotalLength != wantLength {
+			t.Errorf("channel %d TotalLength = %d, want %d", i, got.TotalLength, wantLength)
+		}
+		offset += int64(got.TotalLength)
+	}
+}
+
+func TestGetChannelByIndex(t *testing.T) {
+	cp, _ := openTestCodeplug(t, buildCodeplug(testChannels, testRadioIDs))
+
+	tests := []struct {
+		index   int
+		name    string
+		wantErr string
+	}{
+		{index: 0, name: "Simplex"},
+		{index: 1, name: "Repeater"},
+		{index: 2, name: ""},
+		{index: -1, wantErr: "invalid channel index: -1"},
+		{index: 3, wantErr: "invalid channel index: 3"},
+	}
+
+	for _, tt := range tests {
+		channel, err := cp.GetChannelByIndex(tt.index)
+		if tt.wantErr != "" {
+			if err == nil || err.Error() != tt.wantErr {
+				t.Errorf("GetChannelByIndex(%d) error = %v, want %q", tt.index, err, tt.wantErr)
+			}
+			continue
+		}
+		if err != nil {
+			t.Errorf("GetChannelByIndex(%d) error: %v", tt.index, err)
+			continue
+		}
+		if channel.Name != tt.name {
+			t.Errorf("GetChannelByIndex(%d).Name = %q, want %q", tt.index, channel.Name, tt.name)
+		}
+	}
+}
+
+func TestGetRadioIDByIndex(t *testing.T) {
+	cp, _ := openTestCodeplug(t, buildCodeplug(testChannels, testRadioIDs))
+	tableOffset := radioIDTableOffset(testChannels)
+
+	tests := []struct {
+		index   int
+		want    RadioIDEntry
+		wantErr string
+	}{
+		{index: 0, want: RadioIDEntry{Index: 0, ID: 3161234, Name: "Home", Position: tableOffset, Length: 9}},
+		{index: 1, want: RadioIDEntry{Index: 1, ID: 3165678, Name: "Portable", Position: tableOffset + 9, Length: 13}},
+		{index: 3, want: RadioIDEntry{Index: 3, ID: 1234, Name: "Club", Position: tableOffset + 22, Length: 9}},
+		{index: 2, wantErr: "radio ID with index 2 not found"},
+		{index: 9, wantErr: "radio ID with index 9 not found"},
+		{index: -1, wantErr: "invalid radio ID index: -1"},
+		{index: maxRadioIDs, wantErr: "invalid radio ID index: 10"},
+	}
+
+	for _, tt := range tests {
+		entry, err := cp.GetRadioIDByIndex(tt.index)
+		if tt.wantErr != "" {
+			if err == nil || err.Error() != tt.wantErr {
+				t.Errorf("GetRadioIDByIndex(%d) error = %v, want %q", tt.index, err, tt.wantErr)
+			}
+			continue
+		}
+		if err != nil {
+			t.Errorf("GetRadioIDByIndex(%d) error: %v", tt.index, err)
+			continue
+		}
+		if *entry != tt.want {
+			t.Errorf("GetRadioIDByIndex(%d) = %+v, want %+v", tt.index, *entry, tt.want)
+		}
+	}
+}
+
+func TestTruncatedCodeplug(t *testing.T) {
+	full := buildCodeplug(testChannels, testRadioIDs)
+	lastChannel := radioIDTableOffset(testChannels) - 2 - int64(len(buildChannel(testChannels[2])))
+	tableOffset := radioIDTableOffset(testChannels)
+
+	tests := []struct {
+		name    string
+		size    int64
+		wantErr string
+	}{
+		{name: "channel count", size: totalChannelsAddress, wantErr: "failed to read total channels"},
+		{name: "channel header", size: lastChannel + 10, wantErr: "failed to read channel 3: failed to read channel header"},
+		{name: "channel name", size: lastChannel + channelNameOffset, wantErr: "failed to read channel 3: failed to read channel name"},
+		{name: "trailing fields", size: lastChannel + channelNameOffset + 5, wantErr: "failed to read channel 3: failed to read trailing fields"},
+		{name: "radio ID header", size: tableOffset + 2, wantErr: "failed to read radio ID header"},
+		{name: "radio ID name", size: tableOffset + radioIDHeaderSize + 2, wantErr: "invalid radio ID name"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			cp, _ := openTestCodeplug(t, full[:tt.size])
+
+			_, err := cp.GetRadioIDs()
+			if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+				t.Errorf("GetRadioIDs() error = %v, want %q", err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestInvalidChannelName(t *testing.T) {
+	channels := []testChannel{{name: strings.Repeat("x", channelMaxNameSize)}}
+	cp, _ := openTestCodeplug(t, buildCodeplug(channels, testRadioIDs))
+
+	_, err := cp.GetChannels()
+	if err == nil || !strings.Contains(err.Error(), "no null terminator found") {
+		t.Errorf("GetChannels() error = %v, want no null terminator error", err)
+	}
+}
+
+func TestUpdateRadioID(t *testing.T) {
+	original := buildCodeplug(testChannels, testRadioIDs)
+	tableOffset := radioIDTableOffset(testChannels)
+
+	tests := []struct {
+		index    int
+		newID    int
+		position int64
+	}{
+		{index: 0, newID: 1, position: tableOffset},
+		{index: 1, newID: 999999, position: tableOffset + 9},
+		{index: 3, newID: 0xFFFFFF, position: tableOffset + 22},
+	}
+
+	for _, tt := range tests {
+		cp, path := openTestCodeplug(t, original)
+
+		if err := cp.UpdateRadioID(tt.index, tt.newID); err != nil {
+			t.Fatalf("UpdateRadioID(%d, %d) error: %v", tt.index, tt.newID, err)
+		}
+
+		got, err := os.ReadFile(path)
+		if err != nil {
+			t.Fatalf("failed to read codeplug: %v", err)
+		}
+
+		want := bytes.Clone(original)
+		putUint24(want[tt.position+1:tt.position+4], tt.newID)
+		if !bytes.Equal(got, want) {
+			t.Errorf("UpdateRadioID(%d, %d) wrote unexpected bytes", tt.index, tt.newID)
+		}
+
+		entry, err := cp.GetRadioIDByIndex(tt.index)
+		if err != nil || entry.ID != tt.newID {
+			t.Errorf("GetRadioIDByIndex(%d) after update = %+v, %v", tt.index, entry, err)
+		}
+	}
+
+	cp, _ := openTestCodeplug(t, original)
+	if err := cp.UpdateRadioID(maxRadioIDs, 1); err == nil || err.Error() != "invalid radio ID index: 10" {
+		t.Errorf("UpdateRadioID(10, 1) error = %v", err)
+	}
+}
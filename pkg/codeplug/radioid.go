@@ -1,7 +1,14 @@
 package codeplug
 
 import (
+	"bytes"
 	"fmt"
+	"io"
+)
+
+const (
+	radioIDHeaderSize  = 4
+	radioIDMaxNameSize = 256
 )
 
 type RadioIDEntry struct {
@@ -13,78 +20,91 @@ type RadioIDEntry struct {
 }
 
 func (cp *Codeplug) calculateRadioIDOffset() (int64, error) {
-	channelCountBuf := make([]byte, 1)
-	if _, err := cp.file.ReadAt(channelCountBuf, totalChannelsAddress); err != nil {
-		return 0, fmt.Errorf("failed to read total channels: %w", err)
+	totalChannels, err := cp.readTotalChannels()
+	if err != nil {
+		return 0, err
 	}
 
-	totalChannels := int(channelCountBuf[0])
-
-	channelsStartOffset := int64(totalChannelsAddress + 1)
-
-	currentOffset := channelsStartOffset
-
-	for i := 0; i < totalChannels; i++ {
-		channel, err := cp.readChannelMetadata(currentOffset)
-		if err != nil {
-			return 0, fmt.Errorf("failed to read channel %d: %w", i+1, err)
-		}
-
-		currentOffset += int64(channel.TotalLength)
+	channelsEndOffset, err := cp.skipChannels(totalChannels)
+	if err != nil {
+		return 0, err
 	}
 
-	radioIDOffset := currentOffset + 2
+	radioIDOffset := channelsEndOffset + 2
 
 	return radioIDOffset, nil
 }
 
-func (cp *Codeplug) readRadioIDEntry(offset int64, previousIndex int) (*RadioIDEntry, error) {
-	idHeader := make([]byte, 4)
-	if _, err := cp.file.ReadAt(idHeader, offset); err != nil {
-		return nil, fmt.Errorf("failed to read radio ID header at offset %d: %w", offset, err)
+func decodeRadioIDEntry(data []byte, offset int64, previousIndex int) (*RadioIDEntry, error) {
+	if len(data) < radioIDHeaderSize {
+		return nil, fmt.Errorf("failed to read radio ID header at offset %d: unexpected end of file", offset)
 	}
 
-	index := int(idHeader[0])
+	index := int(data[0])
 
 	if index < previousIndex {
 		return nil, nil
 	}
 
-	id := int(uint32(idHeader[1]) | uint32(idHeader[2])<<8 | uint32(idHeader[3])<<16)
+	id := getUint24(data[1:4])
 
-	buf := make([]byte, 256)
-	if _, err := cp.file.ReadAt(buf, offset+4); err != nil {
-		return nil, fmt.Errorf("failed to read radio ID name at offset %d: %w", offset+4, err)
+	nameBuf := data[radioIDHeaderSize:]
+	if len(nameBuf) > radioIDMaxNameSize {
+		nameBuf = nameBuf[:radioIDMaxNameSize]
 	}
 
-	nameLength := 0
-	for j := 0; j < len(buf); j++ {
-		if buf[j] == 0 {
-			nameLength = j + 1
-			break
-		}
-	}
+	nameLength := bytes.IndexByte(nameBuf, 0) + 1
 
-	name := string(buf[:nameLength-1])
+	if nameLength == 0 {
+		return nil, fmt.Errorf("invalid radio ID name at offset %d: no null terminator found", offset+radioIDHeaderSize)
+	}
 
 	return &RadioIDEntry{
 		Index:    index,
 		ID:       id,
-		Name:     name,
+		Name:     string(nameBuf[:nameLength-1]),
 		Position: offset,
-		Length:   4 + nameLength,
+		Length:   radioIDHeaderSize + nameLength,
 	}, nil
 }
 
+func (cp *Codeplug) readRadioIDEntries(radioIDOffset int64) ([]*RadioIDEntry, error) {
+	buf := make([]byte, maxRadioIDs*(radioIDHeaderSize+radioIDMaxNameSize))
+	n, err := cp.file.ReadAt(buf, radioIDOffset)
+	if err != nil && err != io.EOF {
+		return nil, fmt.Errorf("failed to read radio IDs at offset %d: %w", radioIDOffset, err)
+	}
+	buf = buf[:n]
+
+	pos := 0
+	previousIndex := -1
+	entries := make([]*RadioIDEntry, 0, maxRadioIDs)
+
+	for i := 0; i < maxRadioIDs; i++ {
+		entry, err := decodeRadioIDEntry(buf[pos:], radioIDOffset+int64(pos), previousIndex)
+		if err != nil {
+			return nil, err
+		}
+
+		if entry == nil {
+			break
+		}
+
+		entries = append(entries, entry)
+		previousIndex = entry.Index
+		pos += entry.Length
+	}
+
+	return entries, nil
+}
+
 func (cp *Codeplug) writeRadioIDEntry(entry *RadioIDEntry) error {
 	totalLength := 4 + len(entry.Name) + 1
 	buf := make([]byte, totalLength)
 
 	buf[0] = byte(entry.Index)
 
-	buf[1] = byte(entry.ID & 0xFF)
-	buf[2] = byte((entry.ID >> 8) & 0xFF)
-	buf[3] = byte((entry.ID >> 16) & 0xFF)
+	putUint24(buf[1:4], entry.ID)
 
 	copy(buf[4:], entry.Name)
 
@@ -95,6 +115,17 @@ func (cp *Codeplug) writeRadioIDEntry(entry *RadioIDEntry) error {
 	return nil
 }
 
+func (cp *Codeplug) writeRadioIDValue(entry *RadioIDEntry) error {
+	buf := make([]byte, 3)
+	putUint24(buf, entry.ID)
+
+	if _, err := cp.file.WriteAt(buf, entry.Position+1); err != nil {
+		return fmt.Errorf("failed to write radio ID: %w", err)
+	}
+
+	return nil
+}
+
 func (cp *Codeplug) UpdateRadioID(index int, newID int) error {
 	if index < 0 || index >= maxRadioIDs {
 		return fmt.Errorf("invalid radio ID index: %d", index)
@@ -105,53 +136,30 @@ func (cp *Codeplug) UpdateRadioID(index int, newID int) error {
 		return fmt.Errorf("failed to calculate radio ID offset: %w", err)
 	}
 
-	var currentOffset int64 = radioIDOffset
-	var entry *RadioIDEntry
-	var previousIndex = -1
-	var entries []*RadioIDEntry
-
-	for i := 0; i < maxRadioIDs; i++ {
-		entry, err = cp.readRadioIDEntry(currentOffset, previousIndex)
-		if err != nil {
-			return err
-		}
-
-		if entry == nil {
-			break
-		}
-
-		entries = append(entries, entry)
-		previousIndex = entry.Index
-		currentOffset += int64(entry.Length)
+	entries, err := cp.readRadioIDEntries(radioIDOffset)
+	if err != nil {
+		return err
 	}
 
-	var targetEntry *RadioIDEntry
+	insertPosition := radioIDOffset
 	for _, e := range entries {
 		if e.Index == index {
-			targetEntry = e
-			break
+			e.ID = newID
+			return cp.writeRadioIDValue(e)
 		}
-	}
-
-	if targetEntry != nil {
-		targetEntry.ID = newID
-		return cp.writeRadioIDEntry(targetEntry)
-	}
-
-	var insertPosition int64 = radioIDOffset
-	for _, e := range entries {
 		if e.Index > index {
 			break
 		}
 		insertPosition = e.Position + int64(e.Length)
 	}
 
+	name := fmt.Sprintf("Radio ID %d", index+1)
 	newEntry := &RadioIDEntry{
 		Index:    index,
 		ID:       newID,
-		Name:     fmt.Sprintf("Radio ID %d", index+1),
+		Name:     name,
 		Position: insertPosition,
-		Length:   4 + len(fmt.Sprintf("Radio ID %d", index+1)) + 1,
+		Length:   4 + len(name) + 1,
 	}
 
 	return cp.writeRadioIDEntry(newEntry)
@@ -163,26 +171,7 @@ func (cp *Codeplug) GetRadioIDs() ([]*RadioIDEntry, error) {
 		return nil, fmt.Errorf("failed to calculate radio ID offset: %w", err)
 	}
 
-	var currentOffset int64 = radioIDOffset
-	previousIndex := -1
-	entries := make([]*RadioIDEntry, 0, maxRadioIDs)
-
-	for i := 0; i < maxRadioIDs; i++ {
-		entry, err := cp.readRadioIDEntry(currentOffset, previousIndex)
-		if err != nil {
-			return nil, err
-		}
-
-		if entry == nil {
-			break
-		}
-
-		entries = append(entries, entry)
-		previousIndex = entry.Index
-		currentOffset += int64(entry.Length)
-	}
-
-	return entries, nil
+	return cp.readRadioIDEntries(radioIDOffset)
 }
 
 func (cp *Codeplug) GetRadioIDByIndex(index int) (*RadioIDEntry, error) {
@@ -195,25 +184,18 @@ func (cp *Codeplug) GetRadioIDByIndex(index int) (*RadioIDEntry, error) {
 		return nil, fmt.Errorf("failed to calculate radio ID offset: %w", err)
 	}
 
-	var currentOffset int64 = radioIDOffset
-	previousIndex := -1
-
-	for i := 0; i < maxRadioIDs; i++ {
-		entry, err := cp.readRadioIDEntry(currentOffset, previousIndex)
-		if err != nil {
-			return nil, err
-		}
-
-		if entry == nil {
-			break
-		}
+	entries, err := cp.readRadioIDEntries(radioIDOffset)
+	if err != nil {
+		return nil, err
+	}
 
+	for _, entry := range entries {
 		if entry.Index == index {
 			return entry, nil
 		}
-
-		previousIndex = entry.Index
-		currentOffset += int64(entry.Length)
+		if entry.Index > index {
+			break
+		}
 	}
 
 	return nil, fmt.Errorf("radio ID with index %d not found", index)